@@ -2,6 +2,7 @@
 """ country_converter - Classification converter for countries"""
 
 import argparse
+import functools
 import logging
 import os
 import pprint
@@ -19,6 +20,136 @@ COUNTRY_DATA_FILE = os.path.join(
 
 log = logging.getLogger(__name__)
 
+# alternative names (lower case) for some classifications
+_ALT_CLASS_NAMES = {
+    alt_name.lower(): class_name
+    for class_name, alt_names in {
+        "name_short": ["short", "short_name", "name", "names"],
+        "name_official": ["official", "long_name", "long"],
+        "UNcode": ["un", "unnumeric", "M49"],
+        "ISOnumeric": ["isocode"],
+        "FAOcode": ["fao", "faonumeric"],
+    }.items()
+    for alt_name in alt_names
+}
+
+# maximum number of conversion results kept by each CountryConverter
+_MATCH_CACHE_SIZE = 10000
+
+_MUST_BE_UNIQUE = ["name_short", "name_official", "regex"]
+_MUST_BE_STRING = _MUST_BE_UNIQUE + (
+    ["ISO2", "ISO3", "continent", "UNregion", "EXIO1", "EXIO2", "EXIO3", "WIOD"]
+)
+
+
+def _test_for_unique_names(df, data_name="passed dataframe", report_fun=log.error):
+    """Reports duplicated entries in the columns which must be unique"""
+    for name_entry in _MUST_BE_UNIQUE:
+        if not df[name_entry].is_unique:
+            report_fun(
+                "Duplicated values in column {} of {}".format(name_entry, data_name)
+            )
+
+
+def _read_data_file(data_file):
+    """Reads a country data file (utf-8 encoded, tab separated)"""
+    # converters instead of dtype=str: the string columns must keep "NA"
+    # (ISO2 of Namibia) and empty cells as strings, not as nan
+    ret = pd.read_csv(
+        data_file,
+        sep="\t",
+        encoding="utf-8",
+        converters={str_col: str for str_col in _MUST_BE_STRING},
+        # only local files can be memory mapped (read_csv also accepts urls)
+        memory_map=isinstance(data_file, (str, os.PathLike))
+        and os.path.isfile(data_file),
+    )
+    _test_for_unique_names(ret, data_file)
+    # classification entries (continents, regions, ...) repeat for many
+    # countries, interning keeps one object per distinct entry
+    for col in ret.columns.difference(_MUST_BE_UNIQUE):
+        if pd.api.types.is_string_dtype(ret[col]):
+            ret[col] = ret[col].map(sys.intern, na_action="ignore")
+    return ret
+
+
+@functools.lru_cache(maxsize=1)
+def _load_country_data():
+    """Reads the standard country data file once per session
+
+    The returned DataFrame is shared between all callers and must be treated
+    as read-only - use a copy before any modification.
+    """
+    return _read_data_file(COUNTRY_DATA_FILE)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_exclude(exclude_prefix):
+    """Compiles a tuple of exclude prefixes into one splitting regex"""
+    return re.compile("|".join(exclude_prefix))
+
+
+def _is_int_string(value):
+    """Checks if int() accepts the string, without raising an exception
+
+    Most strings passed around are country names, thus checking the
+    characters is much cheaper than try/except ValueError around int().
+    """
+    value = value.strip()
+    if value[:1] in ("+", "-"):
+        value = value[1:]
+    return value.isdecimal()
+
+
+def _clean_code(entry):
+    """First alternative of a code entry (e.g. ^GB$|^UK$) without regex chars"""
+    if entry.isalnum():
+        return entry
+    return "".join(c for c in entry.partition("|")[0] if c.isalnum())
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_regexes(patterns):
+    """Compiles a tuple of case insensitive regular expressions
+
+    Cached, thus instances based on the same data share the compiled patterns
+    instead of recompiling them on every initialization.
+    """
+    return tuple(re.compile(entry, re.IGNORECASE) for entry in patterns)
+
+
+@functools.lru_cache(maxsize=4)
+def _standard_converter(only_UNmember, include_obsolete):
+    """CountryConverter for the standard data, shared by the module functions"""
+    return CountryConverter(
+        only_UNmember=only_UNmember, include_obsolete=include_obsolete
+    )
+
+
+def _get_converter(
+    country_data=COUNTRY_DATA_FILE,
+    additional_data=None,
+    only_UNmember=False,
+    include_obsolete=False,
+):
+    """CountryConverter for the module level functions
+
+    Converters for the standard data are built once and reused, any other
+    data (DataFrames, custom or additional files) gets a new converter.
+    """
+    if (
+        isinstance(country_data, str)
+        and country_data == COUNTRY_DATA_FILE
+        and additional_data is None
+    ):
+        return _standard_converter(bool(only_UNmember), bool(include_obsolete))
+    return CountryConverter(
+        country_data=country_data,
+        additional_data=additional_data,
+        only_UNmember=only_UNmember,
+        include_obsolete=include_obsolete,
+    )
+
 
 def agg_conc(
     original_countries,
@@ -94,7 +225,7 @@ def agg_conc(
     """
 
     if coco is None:
-        coco = CountryConverter()
+        coco = _get_converter()
 
     if type(original_countries) is str:
         original_countries_class = original_countries_class or original_countries
@@ -219,10 +350,13 @@ def match(
     if isinstance(list_b, tuple):
         list_b = list(list_b)
 
-    coco = CountryConverter(country_data, additional_data)
+    coco = _get_converter(country_data, additional_data)
 
     name_dict_a = dict()
     match_dict_a = dict()
+    # entries of list_b matching a regex - list_b is searched once per
+    # regex, not once for every name in list_a identified by that regex
+    match_dict_b = dict()
 
     for name_a in list_a:
         name_dict_a[name_a] = []
@@ -233,7 +367,7 @@ def match(
                 match_dict_a[name_a].append(regex)
 
         if len(match_dict_a[name_a]) == 0:
-            log.warning("Could not identify {} in list_a".format(name_a))
+            log.warning("Could not identify %s in list_a", name_a)
             _not_found_entry = name_a if not not_found else not_found
             name_dict_a[name_a].append(_not_found_entry)
             if not enforce_sublist:
@@ -241,24 +375,23 @@ def match(
             continue
 
         if len(match_dict_a[name_a]) > 1:
-            log.warning("Multiple matches for name {} in list_a".format(name_a))
+            log.warning("Multiple matches for name %s in list_a", name_a)
 
         for match_case in match_dict_a[name_a]:
-            b_matches = 0
-            for name_b in list_b:
-                if match_case.search(name_b):
-                    b_matches += 1
-                    name_dict_a[name_a].append(name_b)
+            if match_case not in match_dict_b:
+                match_dict_b[match_case] = [
+                    name_b for name_b in list_b if match_case.search(name_b)
+                ]
+            b_matches = len(match_dict_b[match_case])
+            name_dict_a[name_a].extend(match_dict_b[match_case])
 
         if b_matches == 0:
-            log.warning(
-                "Could not find any " "correspondence for {} in list_b".format(name_a)
-            )
+            log.warning("Could not find any correspondence for %s in list_b", name_a)
             _not_found_entry = name_a if not not_found else not_found
             name_dict_a[name_a].append(_not_found_entry)
 
         if b_matches > 1:
-            log.warning("Multiple matches for " "name {} in list_b".format(name_a))
+            log.warning("Multiple matches for name %s in list_b", name_a)
 
         if not enforce_sublist and (len(name_dict_a[name_a]) == 1):
             name_dict_a[name_a] = name_dict_a[name_a][0]
@@ -269,10 +402,11 @@ def match(
 def convert(*args, **kargs):
     """Wrapper around CountryConverter.convert()
 
-    Uses the same parameters. This function has the same performance as
-    CountryConverter.convert for one call; for multiple calls it is better to
-    instantiate a common CountryConverter (this avoid loading the source data
-    file multiple times).
+    Uses the same parameters. For the standard country data, the underlying
+    CountryConverter is built once and reused in subsequent calls. With
+    custom or additional data a new CountryConverter is built for every
+    call - instantiate a common CountryConverter for multiple calls in that
+    case (this avoid loading the data files multiple times).
 
     Note
     ----
@@ -327,7 +461,7 @@ def convert(*args, **kargs):
         "include_obsolete": False,
     }
     init.update({kk: kargs.get(kk) for kk in init.keys() if kk in kargs})
-    coco = CountryConverter(**init)
+    coco = _get_converter(**init)
     kargs = {kk: ii for kk, ii in kargs.items() if kk not in init.keys()}
     return coco.convert(*args, **kargs)
 
@@ -339,7 +473,10 @@ class CountryConverter:
     ----------
 
     data : Pandas DataFrame
-        Raw data read from the country data file
+        Raw data read from the country data file.
+        Conversion results and lookups are cached per instance. After
+        changing data in place (e.g. cc.data.loc[...] = ...) reassign it
+        (cc.data = cc.data), otherwise the previous results are returned.
 
     """
 
@@ -370,7 +507,7 @@ class CountryConverter:
 
         """
 
-        excluder = re.compile("|".join(exclude_prefix))
+        excluder = _compile_exclude(tuple(exclude_prefix))
         split_entries = excluder.split(name)
         return {"clean_name": split_entries[0], "excluded_countries": split_entries[1:]}
 
@@ -407,83 +544,115 @@ class CountryConverter:
 
         """
 
-        must_be_unique = ["name_short", "name_official", "regex"]
-        must_be_string = must_be_unique + (
-            ["ISO2", "ISO3", "continent", "UNregion", "EXIO1", "EXIO2", "EXIO3", "WIOD"]
-        )
-
-        def test_for_unique_names(
-            df, data_name="passed dataframe", report_fun=log.error
-        ):
-            for name_entry in must_be_unique:
-                if df[name_entry].duplicated().any():
-                    report_fun(
-                        "Duplicated values in column {} of {}".format(
-                            name_entry, data_name
-                        )
-                    )
-
         def data_loader(data):
             if isinstance(data, pd.DataFrame):
                 ret = data
-                test_for_unique_names(data)
+                _test_for_unique_names(data)
+            elif isinstance(data, str) and data == COUNTRY_DATA_FILE:
+                ret = _load_country_data()
             else:
-                ret = pd.read_csv(
-                    data,
-                    sep="\t",
-                    encoding="utf-8",
-                    converters={str_col: str for str_col in must_be_string},
-                )
-                test_for_unique_names(ret, data)
+                ret = _read_data_file(data)
             return ret
 
+        # basic_df can be the cached data or a DataFrame passed by the user -
+        # all filters are combined in one mask and applied in one step,
+        # which also returns a new DataFrame and keeps the source untouched
         basic_df = data_loader(country_data)
+        keep_rows = pd.Series(True, index=basic_df.index)
         if only_UNmember:
-            basic_df.dropna(subset=["UNmember"], inplace=True)
-
+            keep_rows &= basic_df.UNmember.notnull()
         if not include_obsolete:
-            basic_df = basic_df[basic_df.obsolete.isnull()]
+            keep_rows &= basic_df.obsolete.isnull()
+        basic_df = basic_df[keep_rows]
 
         if additional_data is None:
             additional_data = []
-        if not isinstance(additional_data, list):
+        if not isinstance(additional_data, (list, tuple)):
             additional_data = [additional_data]
 
         add_data = [data_loader(df) for df in additional_data]
-        self.data = pd.concat(
-            [basic_df] + add_data, ignore_index=True, axis=0, sort=True
-        )
-        test_for_unique_names(
+        if add_data:
+            self.data = pd.concat(
+                [basic_df] + add_data, ignore_index=True, axis=0, sort=True
+            )
+        else:
+            # same column order as concat(sort=True), without the concat copy
+            self.data = basic_df.sort_index(axis=1)
+        _test_for_unique_names(
             self.data, data_name="merged data - keep last one", report_fun=log.warning
         )
 
-        for name_entry in must_be_unique:
+        for name_entry in _MUST_BE_UNIQUE:
             self.data.drop_duplicates(subset=[name_entry], keep="last", inplace=True)
 
         self.data.reset_index(drop=True, inplace=True)
-        self.regexes = [re.compile(entry, re.IGNORECASE) for entry in self.data.regex]
-        self.iso2_regexes = [
-            re.compile(entry, re.IGNORECASE) for entry in self.data.ISO2
-        ]
 
-        # the following section adds shortcuts to all classifications to the
-        # class.
-        def fun_provider(df, datacol):
-            def fun_provided(to):
-                ret = df.loc[:, [to, datacol]].dropna()
+    @property
+    def data(self):
+        """The country data used for all conversions (pandas DataFrame)
+
+        All lookups derived from the data are built on first use. Assigning
+        a DataFrame (also the same one, cc.data = cc.data) resets them,
+        changing the DataFrame in place does not.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        # compiled on first use, see the regexes and iso2_regexes properties
+        self._regexes = None
+        self._iso2_regexes = None
+        self._iso2_rows = None
+        # row lookup for exact matching per classification, built on first use
+        self._match_rows = {}
+        # (source, name, target) -> matching entries of previous conversions
+        self._match_cache = {}
+        # (column names, lower case name -> column name), see
+        # _validate_input_para
+        self._class_lookup = (None, {})
+        # classification shortcuts, see __getattr__
+        self._shortcuts = {}
+
+    def __getattr__(self, name):
+        """Shortcuts to all classifications, built on first access
+
+        For each column of data, e.g. EU, the attribute EU holds the
+        name_short/EU entries and EUas(to) returns the to/EU entries.
+        """
+        # only called for attributes not found otherwise; the data is
+        # checked in __dict__ to avoid recursion before it is set
+        data = self.__dict__.get("_data")
+        if data is None:
+            raise AttributeError(name)
+
+        shortcut = self._shortcuts.get(name)
+        if shortcut is not None:
+            return shortcut
+
+        if name in data.columns:
+            shortcut = data.loc[:, ["name_short", name]].dropna()
+        elif name.endswith("as") and name[:-2] in data.columns:
+            datacol = name[:-2]
+
+            def shortcut(to):
+                ret = data.loc[:, [to, datacol]].dropna()
                 if to in ["ISO2", "ISO3"]:
-                    ret.loc[:, to] = (
-                        ret.loc[:, to]
-                        .str.split("|")
-                        .apply(lambda x: "".join((c for c in x[0] if c.isalnum())))
-                    )
+                    ret.loc[:, to] = ret.loc[:, to].map(_clean_code)
                 return ret
 
-            return fun_provided
+        else:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+            )
 
-        for col in self.data.columns:
-            self.__setattr__(col, self.data.loc[:, ["name_short", col]].dropna())
-            self.__setattr__(col + "as", fun_provider(self.data, col))
+        self._shortcuts[name] = shortcut
+        return shortcut
+
+    def __dir__(self):
+        """Includes the classification shortcuts, e.g. for tab completion"""
+        columns = list(self.data.columns)
+        return list(super().__dir__()) + columns + [col + "as" for col in columns]
 
     def convert(
         self,
@@ -555,84 +724,149 @@ class CountryConverter:
         else:
             names = [str(names)]
 
-        outlist = names.copy()
+        outlist = []
 
-        to = [self._validate_input_para(to, self.data.columns.tolist())]
+        to = self._validate_input_para(to, self.data.columns)
+        if src is not None:
+            src_format = self._validate_input_para(src, self.data.columns)
 
-        exclude_split = {
-            name: self._separate_exclude_cases(name, exclude_prefix) for name in names
-        }
+        # names without excluded parts and their source classification,
+        # determined once per distinct name
+        clean_names = {}
 
-        for ind_names, current_name in enumerate(names):
-            spec_name = exclude_split[current_name]["clean_name"]
+        excluder = _compile_exclude(tuple(exclude_prefix))
 
-            if src is None:
-                src_format = self._get_input_format_from_name(spec_name)
-            else:
-                src_format = self._validate_input_para(src, self.data.columns.tolist())
-
-            # if src_format.lower() == "regex":
-            if src_format.lower() in ["regex", "iso2"]:
-                result_list = []
-                # for ind_regex, ccregex in enumerate(self.regexes):
-                if src_format.lower() == "iso2":
-                    regexes = self.iso2_regexes
-                elif src_format.lower() == "regex":
-                    regexes = self.regexes
-                for ind_regex, ccregex in enumerate(regexes):
-                    if ccregex.search(spec_name):
-                        result_list.append(self.data.loc[ind_regex, to].values[0])
-                    if len(result_list) > 1:
-                        log.warning(
-                            "More then one regular expression "
-                            "match for {}".format(spec_name)
-                        )
+        # bound methods used for every (distinct) name
+        get_clean_name = clean_names.get
+        get_entries = self._match_cache.get
+        add_output = outlist.append
+        split_excluded = excluder.split
+        guess_format = self._get_input_format_from_name
 
+        for current_name in names:
+            clean_name = get_clean_name(current_name)
+            if clean_name is not None:
+                spec_name, src_format, cache_key = clean_name
             else:
-                _match_col = (
-                    self.data[src_format]
-                    .astype(str)
-                    .str.replace("\\..*", "", regex=True)
-                )
-
-                result_list = [
-                    etr[0]
-                    for etr in self.data[
-                        _match_col.str.contains(
-                            "^" + re.escape(spec_name) + "$",
-                            flags=re.IGNORECASE,
-                            na=False,
-                        )
-                    ][to].values
-                ]
-
-            if len(result_list) == 0:
-                log.warning("{} not found in {}".format(spec_name, src_format))
+                # same as the clean_name of _separate_exclude_cases, without
+                # splitting off and collecting all excluded countries
+                spec_name = split_excluded(current_name, maxsplit=1)[0]
+                if src is None:
+                    src_format = guess_format(spec_name)
+                # the matching entries only depend on the name, source and
+                # target classification and are kept for following calls.
+                # Matching is case insensitive, thus the name is lower cased
+                # for sharing the entries between e.g. 'GERMANY' and 'Germany'
+                cache_key = (src_format, spec_name.lower(), to)
+                clean_names[current_name] = (spec_name, src_format, cache_key)
+
+            entries = get_entries(cache_key)
+            if entries is None:
+                entries = self._match_entries(spec_name, src_format, to)
+                if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+                    self._match_cache.clear()
+                self._match_cache[cache_key] = entries
+
+            if len(entries) > 1 and src_format.lower() in ["regex", "iso2"]:
+                log.warning("More then one regular expression match for %s", spec_name)
+
+            if len(entries) == 0:
+                log.warning("%s not found in %s", spec_name, src_format)
                 _fillin = not_found or spec_name
-                outlist[ind_names] = [_fillin] if enforce_list else _fillin
+                add_output([_fillin] if enforce_list else _fillin)
+            elif len(entries) == 1 and enforce_list is False:
+                add_output(entries[0])
             else:
-                outlist[ind_names] = []
-                for etr in result_list:
-                    if to[0].lower() in ["iso2", "iso3"]:
-                        # remove regex characters from output
-                        etr = "".join(
-                            c for c in etr.split("|")[0] if c.isalnum()
-                        ).upper()
-
-                    try:
-                        conv_etr = int(etr)
-                    except ValueError:
-                        conv_etr = etr
-                    outlist[ind_names].append(conv_etr)
-
-                if len(outlist[ind_names]) == 1 and enforce_list is False:
-                    outlist[ind_names] = outlist[ind_names][0]
+                add_output(list(entries))
 
         if (len(outlist) == 1) and not enforce_list:
             return outlist[0]
         else:
             return outlist
 
+    def _match_entries(self, name, src_format, to):
+        """Entries of 'to' for all rows matching name in src_format
+
+        Parameters
+        ----------
+
+        name : string
+            Name without any excluded parts
+        src_format : string
+            Validated source classification
+        to : string
+            Validated output classification
+
+        Returns
+        -------
+
+        tuple : matching entries, casted to int where possible
+        """
+        # src_format and to are the validated column names, so no need to
+        # compare lower case versions
+        if src_format == "ISO2" and len(name) == 2 and name.isascii():
+            # a plain two letter code only matches a two character name
+            # if both are equal, thus only the remaining entries (e.g.
+            # ^GB$|^UK$) need a regex search
+            code_rows, pattern_rows = self._iso2_lookup
+            regexes = self.iso2_regexes
+            matching_rows = code_rows.get(name.lower(), []) + [
+                ind_regex
+                for ind_regex in pattern_rows
+                if regexes[ind_regex].search(name)
+            ]
+            matching_rows.sort()
+            result_list = self.data[to].values[matching_rows]
+
+        elif src_format in ("regex", "ISO2"):
+            if src_format == "ISO2":
+                regexes = self.iso2_regexes
+            else:
+                regexes = self.regexes
+            # collect all matching rows first and get the target
+            # values in one go instead of one .loc lookup per match
+            matching_rows = [
+                ind_regex
+                for ind_regex, ccregex in enumerate(regexes)
+                if ccregex.search(name)
+            ]
+            result_list = self.data[to].values[matching_rows]
+
+        else:
+            # rows per cleaned, lower case entry of the classification,
+            # built once per classification and used for all names
+            match_rows = self._match_rows.get(src_format)
+            if match_rows is None:
+                match_col = (
+                    self.data[src_format]
+                    .astype(str)
+                    .str.replace("\\..*", "", regex=True)
+                    .str.lower()
+                )
+                match_rows = {}
+                for ind_row, entry in enumerate(match_col):
+                    match_rows.setdefault(entry, []).append(ind_row)
+                self._match_rows[src_format] = match_rows
+
+            result_list = self.data[to].values[match_rows.get(name.lower(), [])]
+
+        clean_iso = to in ("ISO2", "ISO3")
+        entries = []
+        for etr in result_list:
+            if clean_iso:
+                # remove regex characters from output
+                etr = _clean_code(etr).upper()
+
+            if isinstance(etr, str):
+                conv_etr = int(etr) if _is_int_string(etr) else etr
+            elif etr == etr:  # False for nan
+                conv_etr = int(etr)
+            else:
+                conv_etr = etr
+            entries.append(conv_etr)
+
+        return tuple(entries)
+
     def pandas_convert(
         self,
         series: pd.Series,
@@ -652,7 +886,7 @@ class CountryConverter:
 
         Parameters
         ----------
-        series : str or list like
+        series : Pandas Series
             Countries in 'src' classification to convert
             to 'to' classification.
 
@@ -699,7 +933,8 @@ class CountryConverter:
         # Get the unique values for mapping.
         s_unique = series.unique()
 
-        # Create a correspondence dictionary
+        # Create a correspondence Series - map uses it directly, whereas a
+        # dict would be converted to a Series again
         mapping = pd.Series(
             self.convert(
                 names=s_unique,
@@ -710,10 +945,42 @@ class CountryConverter:
                 exclude_prefix=exclude_prefix,
             ),
             index=s_unique,
-        ).to_dict()
+        )
 
         return series.map(mapping).fillna(series if not_found is None else not_found)
 
+    @property
+    def regexes(self):
+        """Compiled regular expressions of the regex column"""
+        if self._regexes is None:
+            self._regexes = list(_compile_regexes(tuple(self.data.regex)))
+        return self._regexes
+
+    @property
+    def iso2_regexes(self):
+        """Compiled regular expressions of the ISO2 column"""
+        if self._iso2_regexes is None:
+            self._iso2_regexes = list(_compile_regexes(tuple(self.data.ISO2)))
+        return self._iso2_regexes
+
+    @property
+    def _iso2_lookup(self):
+        """Rows of plain two letter ISO2 codes and of all other ISO2 entries
+
+        Returns a tuple of a dict (lower case code -> row positions) and a
+        list with the row positions of the entries which need a regex search.
+        """
+        if self._iso2_rows is None:
+            code_rows = {}
+            pattern_rows = []
+            for ind_row, entry in enumerate(self.data.ISO2):
+                if len(entry) == 2 and entry.isascii() and entry.isalnum():
+                    code_rows.setdefault(entry.lower(), []).append(ind_row)
+                else:
+                    pattern_rows.append(ind_row)
+            self._iso2_rows = (code_rows, pattern_rows)
+        return self._iso2_rows
+
     @property
     def valid_class(self):
         """Valid strings for the converter"""
@@ -725,7 +992,7 @@ class CountryConverter:
         return [
             cname
             for cname in self.data.columns
-            if not (self.data[cname].dropna().duplicated().any() or cname == "obsolete")
+            if self.data[cname].dropna().is_unique and cname != "obsolete"
         ]
 
     def get_correspondence_dict(
@@ -773,17 +1040,31 @@ class CountryConverter:
             df = self.data[restrict].loc[:, [classA, classB]].copy()
 
         if replace_nan:
-            df.loc[:, classA].fillna(replace_nan, inplace=True)
+            df[classA] = df[classA].fillna(replace_nan)
 
         if replace_numeric:
-            if df[classB].dtype.kind in "bifc":
-                df.loc[~df[classB].isnull(), classB] = classB
-                df.loc[df[classB].isnull(), classB] = None
-            if df[classA].dtype.kind in "bifc":
-                df.loc[~df[classA].isnull(), classA] = classA
-                df.loc[df[classA].isnull(), classA] = None
-
-        result = df.groupby(classA).agg(lambda x: list(x.unique())).to_dict()[classB]
+            # one new object column per class instead of two masked writes
+            # into the numeric column
+            for numeric_class in (classB, classA):
+                if df[numeric_class].dtype.kind in "bifc":
+                    df[numeric_class] = pd.Series(
+                        numeric_class, index=df.index, dtype=object
+                    ).where(df[numeric_class].notnull(), None)
+
+        # unique pairs grouped into lists by classA, sorted and without
+        # missing keys as a groupby would return them. The stable sort keeps
+        # the order of appearance within each group, so the dict is built
+        # in its final order directly.
+        unique_pairs = (
+            df.dropna(subset=[classA])
+            .drop_duplicates()
+            .sort_values(classA, kind="stable")
+        )
+        result = {}
+        for key_a, entry_b in zip(
+            unique_pairs[classA].tolist(), unique_pairs[classB].values
+        ):
+            result.setdefault(key_a, []).append(entry_b)
 
         return result
 
@@ -794,7 +1075,7 @@ class CountryConverter:
         ----------
 
         para : string
-        column_names : list of strings
+        column_names : list like of strings
 
         Returns
         -------
@@ -802,25 +1083,20 @@ class CountryConverter:
         validated_para : string
             Converted to the case used in the country file
         """
-        lower_case_valid_class = [et.lower() for et in self.valid_class]
-
-        alt_valid_names = {
-            "name_short": ["short", "short_name", "name", "names"],
-            "name_official": ["official", "long_name", "long"],
-            "UNcode": ["un", "unnumeric", "M49"],
-            "ISOnumeric": ["isocode"],
-            "FAOcode": ["fao", "faonumeric"],
-        }
-
-        for item in alt_valid_names.items():
-            if para.lower() in item[1]:
-                para = item[0]
-
-        try:
-            validated_para = self.valid_class[
-                lower_case_valid_class.index(para.lower())
-            ]
-        except ValueError:
+        # the lookup is kept for the column names it was built from
+        # (convert passes the same data.columns for every call)
+        if column_names is not self._class_lookup[0]:
+            # reversed: the first column wins if names only differ in case
+            self._class_lookup = (
+                column_names,
+                {et.lower(): et for et in reversed(list(column_names))},
+            )
+        lower_case_valid_class = self._class_lookup[1]
+
+        para = _ALT_CLASS_NAMES.get(para.lower(), para)
+
+        validated_para = lower_case_valid_class.get(para.lower())
+        if validated_para is None:
             raise KeyError("{} is not a valid country classification".format(para))
 
         return validated_para
@@ -831,23 +1107,31 @@ class CountryConverter:
         Parameters
         ----------
 
-        name : string
+        name : string or number
 
         Returns
         -------
 
         string : valid input format
         """
-        try:
-            int(name)
+        if isinstance(name, str):
+            is_numeric = _is_int_string(name)
+        else:
+            # numbers, e.g. numpy ints or floats passed by agg_conc
+            try:
+                int(name)
+                is_numeric = True
+            except (TypeError, ValueError):
+                is_numeric = False
+
+        if is_numeric:
             src_format = "ISOnumeric"
-        except ValueError:
-            if len(name) == 2:
-                src_format = "ISO2"
-            elif len(name) == 3:
-                src_format = "ISO3"
-            else:
-                src_format = "regex"
+        elif len(name) == 2:
+            src_format = "ISO2"
+        elif len(name) == 3:
+            src_format = "ISO3"
+        else:
+            src_format = "regex"
         return src_format
 
 
@@ -979,7 +1263,9 @@ def cli_output(conv_names, sep):
 
 def main():
     """Main entry point - used for command line call"""
-    args = _parse_arg(CountryConverter().valid_class)
+    # the help text only needs the classification names - no need to
+    # build a full converter before the one for the passed arguments
+    args = _parse_arg(sorted(_load_country_data().columns))
 
     args.output_sep = args.output_sep or " "
     args.src = args.src or None
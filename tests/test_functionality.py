@@ -2,9 +2,12 @@
 """
 
 import collections
+import functools
+import http.server
 import logging
 import os
 import sys
+import threading
 import warnings
 from collections import OrderedDict
 
@@ -150,6 +153,31 @@ def test_additional_country_file():
     assert converter_extended.convert("wirtland", to="name_short") == "Wirtland"
     assert 250 == converter_extended.convert("Congo", to="FAOcode")
 
+    converter_tuple = coco.CountryConverter(additional_data=(custom_data,))
+    assert converter_tuple.convert("wirtland", to="name_short") == "Wirtland"
+
+
+@pytest.fixture(scope="module")
+def country_data_url():
+    """Serves the directory of the country data file over http"""
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler,
+        directory=os.path.dirname(coco.country_converter.COUNTRY_DATA_FILE),
+    )
+    server = http.server.HTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}/{}".format(
+        server.server_port, os.path.basename(coco.country_converter.COUNTRY_DATA_FILE)
+    )
+    server.shutdown()
+    server.server_close()
+
+
+def test_country_data_url(country_data_url):
+    cc = coco.CountryConverter(country_data=country_data_url)
+    assert cc.convert("DEU", to="ISO2") == "DE"
+
 
 def test_additional_country_data():
     add_data = pd.DataFrame.from_dict(
@@ -182,6 +210,52 @@ def test_obsolete():
     assert len(cc.data) == 256
 
 
+def test_cached_data_not_modified():
+    """Instances share the parsed data file, changes must not leak"""
+    cc_un = coco.CountryConverter(only_UNmember=True)
+    cc_un.data.drop(cc_un.data.index, inplace=True)
+    cc = coco.CountryConverter(include_obsolete=True)
+    assert len(cc.data) == 256
+    assert cc.convert("Germany") == "DEU"
+
+
+def test_passed_data_not_modified():
+    data = coco.CountryConverter(include_obsolete=True).data
+    nr_rows = len(data)
+    cc = coco.CountryConverter(country_data=data, only_UNmember=True)
+    assert len(cc.data) == 193
+    assert len(data) == nr_rows
+
+
+def test_reassign_data():
+    cc = coco.CountryConverter()
+    assert cc.convert("FRA", to="ISO2") == "FR"
+    assert cc.convert("USA", to="name_short") == "United States"
+    assert len(cc.EU28) == 28
+    cc.data = cc.data.iloc[::-1].reset_index(drop=True)
+    assert cc.convert("FRA", to="ISO2") == "FR"
+    cc.data = cc.data[cc.data.continent == "Europe"].reset_index(drop=True)
+    assert cc.convert("USA", to="name_short") == "not found"
+    assert cc.convert("US", to="name_short") == "not found"
+    assert cc.convert("France", to="ISO2") == "FR"
+    assert len(cc.EU28) == len(cc.data.EU28.dropna())
+
+
+def test_change_data_in_place():
+    """In place changes of data are used only after reassigning data"""
+    cc = coco.CountryConverter()
+    assert cc.convert("DEU", to="name_short") == "Germany"
+    assert cc.convert("AUT", to="name_short") == "Austria"
+    cc.data.loc[cc.data.ISO3 == "DEU", "name_short"] = "Deutschland"
+    cc.data.loc[cc.data.ISO3 == "AUT", "ISO3"] = "OST"
+    assert cc.convert("DEU", to="name_short") == "Germany"
+    assert cc.convert("AUT", to="name_short") == "Austria"
+    cc.data = cc.data
+    assert cc.convert("DEU", to="name_short") == "Deutschland"
+    assert cc.convert("AUT", to="name_short") == "not found"
+    assert cc.convert("OST", to="name_short") == "Austria"
+
+
 def test_special_cases():
     """Some test for special cases which occurred during development.
 
@@ -194,6 +268,21 @@ def test_special_cases():
     assert converter("NAM", to="ISO2") == "NA"
 
 
+def test_input_format_from_name():
+    cc = coco.CountryConverter()
+    assert cc._get_input_format_from_name("276") == "ISOnumeric"
+    assert cc._get_input_format_from_name(" 40") == "ISOnumeric"
+    assert cc._get_input_format_from_name(40) == "ISOnumeric"
+    assert cc._get_input_format_from_name(np.int64(40)) == "ISOnumeric"
+    assert cc._get_input_format_from_name(40.0) == "ISOnumeric"
+    assert cc._get_input_format_from_name(np.float64(40.0)) == "ISOnumeric"
+    assert cc._get_input_format_from_name("DE") == "ISO2"
+    assert cc._get_input_format_from_name("DEU") == "ISO3"
+    assert cc._get_input_format_from_name("40.5") == "regex"
+    assert cc._get_input_format_from_name("Germany") == "regex"
+    assert cc.convert(["276", "40"], to="ISO3") == ["DEU", "AUT"]
+
+
 def test_iterable_inputs():
     """Test the different possibilites to input lists
 
@@ -471,6 +560,36 @@ def test_regex_warnings(caplog):
     assert "not found in regex" in caplog.text
 
 
+def test_repeated_conversion(caplog):
+    cc = coco.CountryConverter()
+    names = ["Germany", "DEU", "abc", "DE"]
+    assert cc.convert(names, to="name_short") == cc.convert(names, to="name_short")
+    assert cc.convert("DEU", to="ISO2", enforce_list=True) == [["DE"]]
+    assert cc.convert("DEU", to="ISO2", enforce_list=True) == [["DE"]]
+    caplog.clear()
+    assert cc.convert("abc", to="name_short") == "not found"
+    assert "abc not found in ISO3" in caplog.text
+
+    # cached entries must not outlive the data they are based on
+    assert cc.convert("DEU", to="name_short") == "Germany"
+    data = cc.data.copy()
+    data.loc[data.ISO3 == "DEU", "name_short"] = "Deutschland"
+    cc.data = data
+    assert cc.convert("DEU", to="name_short") == "Deutschland"
+
+
+def test_iso2_exact_lookup():
+    cc = coco.CountryConverter(include_obsolete=True)
+    names = list(cc.data.ISO2) + ["uk", "Gb", "xx", "D E"]
+    for name in names:
+        by_regex = [
+            ind for ind, ccregex in enumerate(cc.iso2_regexes) if ccregex.search(name)
+        ]
+        assert cc._match_entries(name, "ISO2", "name_short") == tuple(
+            cc.data.name_short.values[by_regex]
+        )
+
+
 def test_cli_output(capsys):
     inp_list = ["a", "b"]
     exp_string = "a-b"
@@ -494,6 +613,14 @@ def test_wrapper_convert():
     assert "AT" == coco.convert("40", to="ISO2")
 
 
+def test_alternative_classification_names():
+    cc = coco.CountryConverter()
+    assert cc.convert("DEU", to="short") == "Germany"
+    assert cc.convert("DEU", to="UNnumeric") == 276
+    assert cc.convert("DEU", to="M49") == 276
+    assert cc.convert("276", src="m49", to="ISO3") == "DEU"
+
+
 def test_convert_wrong_classification():
     with pytest.raises(KeyError) as _:
         coco.convert("usa", src="abc")
@@ -556,6 +683,9 @@ def test_properties():
     assert all(cc.EU27 == cc.EU27as(to="name_short"))
     assert all(cc.OECD == cc.OECDas(to="name_short"))
     assert all(cc.UN == cc.UNas(to="name_short"))
+    assert "EU28" in dir(cc)
+    assert "EU27as" in dir(cc)
+    assert "convert" in dir(cc)
 
 
 def test_parser():